@@ -678,12 +678,15 @@ class Cloud:
                 region=None,
                 keys=('ssh_proxy_command',),
                 default_value=None) is not None:
-            unsupported_features2reason.update({
+            # Build a new dict rather than updating in place: subclasses may
+            # return their shared class-level _CLOUD_UNSUPPORTED_FEATURES.
+            unsupported_features2reason = {
+                **unsupported_features2reason,
                 CloudImplementationFeatures.DOCKER_IMAGE: (
                     f'Docker image is currently not supported on {cls._REPR} '
                     'when proxy command is set. Please remove proxy command in '
                     'the config.'),
-            })
+            }
 
         unsupported_features = set(unsupported_features2reason.keys())
         unsupported_features = requested_features.intersection(
@@ -7,6 +7,7 @@ from sky import catalog
 from sky import clouds
 from sky.adaptors import common as adaptors_common
 from sky.provision.paperspace import utils
+from sky.utils import annotations
 from sky.utils import registry
 from sky.utils import resources_utils
 
@@ -22,6 +23,10 @@ _CREDENTIAL_FILES = [
     # credential files for Paperspace,
     'config.json',
 ]
+_CREDENTIAL_FILE_MOUNTS = {
+    f'~/.paperspace/{filename}': f'~/.paperspace/{filename}'
+    for filename in _CREDENTIAL_FILES
+}
 
 
 @registry.CLOUD_REGISTRY.register
@@ -52,7 +57,6 @@ class Paperspace(clouds.Cloud):
              f'{_REPR}.'),
     }
     _MAX_CLUSTER_NAME_LEN_LIMIT = 120
-    _regions: List[clouds.Region] = []
 
     # Using the latest SkyPilot provisioner API to provision and check status.
     PROVISIONER_VERSION = clouds.ProvisionerVersion.SKYPILOT
@@ -91,13 +95,24 @@ class Paperspace(clouds.Cloud):
         del accelerators, zone  # unused
         if use_spot:
             return []
-        else:
-            regions = catalog.get_region_zones_for_instance_type(
-                instance_type, use_spot, 'paperspace')
+        regions = cls._regions_for_instance_type(instance_type)
 
         if region is not None:
-            regions = [r for r in regions if r.name == region]
-        return regions
+            # Region names are unique, so stop at the first match.
+            match = next((r for r in regions if r.name == region), None)
+            return [] if match is None else [match]
+        return list(regions)
+
+    @classmethod
+    @annotations.lru_cache(scope='request', maxsize=128)
+    def _regions_for_instance_type(
+            cls, instance_type: str) -> Tuple[clouds.Region, ...]:
+        # Cached since the optimizer and zones_provision_loop query the same
+        # instance type repeatedly. Paperspace has no spot offering, so only
+        # on-demand regions are looked up.
+        return tuple(
+            catalog.get_region_zones_for_instance_type(instance_type, False,
+                                                       'paperspace'))
 
     @classmethod
     def get_vcpus_mem_from_instance_type(
@@ -178,6 +193,14 @@ class Paperspace(clouds.Cloud):
     @classmethod
     def get_accelerators_from_instance_type(
             cls, instance_type: str) -> Optional[Dict[str, Union[int, float]]]:
+        accelerators = cls._accelerators_from_instance_type(instance_type)
+        # Copy so that callers cannot mutate the cached value.
+        return None if accelerators is None else dict(accelerators)
+
+    @classmethod
+    @annotations.lru_cache(scope='request', maxsize=256)
+    def _accelerators_from_instance_type(
+            cls, instance_type: str) -> Optional[Dict[str, Union[int, float]]]:
         return catalog.get_accelerators_from_instance_type(instance_type,
                                                            clouds='paperspace')
 
@@ -222,16 +245,15 @@ class Paperspace(clouds.Cloud):
             return resources_utils.FeasibleResources([resources], [], None)
 
         def _make(instance_list):
-            resource_list = []
-            for instance_type in instance_list:
-                r = resources.copy(
-                    cloud=Paperspace(),
+            # Cloud objects are stateless, so all candidates can share `self`.
+            return [
+                resources.copy(
+                    cloud=self,
                     instance_type=instance_type,
                     accelerators=None,
                     cpus=None,
-                )
-                resource_list.append(r)
-            return resource_list
+                ) for instance_type in instance_list
+            ]
 
         # Currently, handle a filter on accelerators only.
         accelerators = resources.accelerators
@@ -250,7 +272,7 @@ class Paperspace(clouds.Cloud):
                     _make([default_instance_type]), [], None)
 
         assert len(accelerators) == 1, resources
-        acc, acc_count = list(accelerators.items())[0]
+        acc, acc_count = next(iter(accelerators.items()))
         (instance_list,
          fuzzy_candidate_list) = (catalog.get_instance_type_for_accelerator(
              acc,
@@ -274,8 +296,8 @@ class Paperspace(clouds.Cloud):
         """Checks if the user has access credentials to
         Paperspace's compute service."""
         try:
-            # attempt to make a CURL request for listing instances
-            utils.PaperspaceCloudClient().list_instances()
+            # Probe with a single page instead of listing all instances.
+            utils.PaperspaceCloudClient().check_credentials()
         except (AssertionError, KeyError, utils.PaperspaceCloudError) as e:
             # pylint: disable=line-too-long
             return False, (
@@ -295,10 +317,7 @@ class Paperspace(clouds.Cloud):
         return True, None
 
     def get_credential_file_mounts(self) -> Dict[str, str]:
-        return {
-            f'~/.paperspace/{filename}': f'~/.paperspace/{filename}'
-            for filename in _CREDENTIAL_FILES
-        }
+        return _CREDENTIAL_FILE_MOUNTS
 
     @classmethod
     def get_user_identities(cls) -> Optional[List[List[str]]]:
@@ -1,13 +1,14 @@
 """Paperspace instance provisioning."""
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
 from sky import sky_logging
 from sky.provision import common
 from sky.provision.paperspace import utils
 from sky.utils import common_utils
 from sky.utils import status_lib
+from sky.utils import subprocess_utils
 from sky.utils import ux_utils
 
 # The maximum number of times to poll for the status of an operation.
@@ -15,14 +16,47 @@ POLL_INTERVAL = 5
 MAX_POLLS = 60 // POLL_INTERVAL
 # Stopping instances can take several minutes, so we increase the timeout
 MAX_POLLS_FOR_UP_OR_STOP = MAX_POLLS * 16
+# Jittered backoff for the unbounded wait loops: start polling after ~1s so
+# state changes are noticed quickly, and back off to at most ~10s.
+INITIAL_BACKOFF_SECONDS = 1
+MAX_BACKOFF_FACTOR = 10
 
 logger = sky_logging.init_logger(__name__)
 
-
-def _filter_instances(cluster_name_on_cloud: str,
-                      status_filters: Optional[List[str]]) -> Dict[str, Any]:
-    client = utils.PaperspaceCloudClient()
-    instances = client.list_instances()
+_PENDING_STATES = frozenset(
+    {'starting', 'restarting', 'upgrading', 'provisioning', 'stopping'})
+_PENDING_OR_OFF_STATES = _PENDING_STATES | {'off'}
+_EXISTING_STATES = _PENDING_STATES | {'ready', 'off'}
+_STOPPABLE_STATES = frozenset({
+    'ready', 'serviceready', 'upgrading', 'provisioning', 'starting',
+    'restarting'
+})
+
+# https://docs.digitalocean.com/reference/paperspace/core/commands/machines/#show
+_STATUS_MAP: Dict[str, Optional[status_lib.ClusterStatus]] = {
+    'starting': status_lib.ClusterStatus.INIT,
+    'restarting': status_lib.ClusterStatus.INIT,
+    'upgrading': status_lib.ClusterStatus.INIT,
+    'provisioning': status_lib.ClusterStatus.INIT,
+    'stopping': status_lib.ClusterStatus.STOPPED,
+    'serviceready': status_lib.ClusterStatus.INIT,
+    'ready': status_lib.ClusterStatus.UP,
+    'off': status_lib.ClusterStatus.STOPPED,
+}
+
+
+def _filter_instances(
+    cluster_name_on_cloud: str,
+    status_filters: Optional[Collection[str]],
+    instances: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Filters the cluster's instances by state.
+
+    If `instances` is given, it is used instead of listing the instances
+    again, so that several filters can share one snapshot.
+    """
+    if instances is None:
+        instances = utils.PaperspaceCloudClient().list_instances()
     possible_names = [
         f'{cluster_name_on_cloud}-head',
         f'{cluster_name_on_cloud}-worker',
@@ -52,15 +86,14 @@ def run_instances(region: str, cluster_name_on_cloud: str,
                   config: common.ProvisionConfig) -> common.ProvisionRecord:
     """Runs instances for the given cluster."""
 
-    pending_status = [
-        'starting', 'restarting', 'upgrading', 'provisioning', 'stopping'
-    ]
     newly_started_instances = _filter_instances(cluster_name_on_cloud,
-                                                pending_status + ['off'])
+                                                _PENDING_OR_OFF_STATES)
     client = utils.PaperspaceCloudClient()
 
+    backoff = common_utils.Backoff(initial_backoff=INITIAL_BACKOFF_SECONDS,
+                                   max_backoff_factor=MAX_BACKOFF_FACTOR)
     while True:
-        instances = _filter_instances(cluster_name_on_cloud, pending_status)
+        instances = _filter_instances(cluster_name_on_cloud, _PENDING_STATES)
         if not instances:
             break
         instance_statuses = [
@@ -68,28 +101,37 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         ]
         logger.info(f'Waiting for {len(instances)} instances to be ready: '
                     f'{instance_statuses}')
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
 
+    # Both filters below read the same listing; nothing changes in between.
+    all_instances = client.list_instances()
     exist_instances = _filter_instances(cluster_name_on_cloud,
-                                        status_filters=pending_status +
-                                        ['ready', 'off'])
+                                        status_filters=_EXISTING_STATES,
+                                        instances=all_instances)
     if len(exist_instances) > config.count:
         raise RuntimeError(
             f'Cluster {cluster_name_on_cloud} already has '
             f'{len(exist_instances)} nodes, but {config.count} are required.')
 
     stopped_instances = _filter_instances(cluster_name_on_cloud,
-                                          status_filters=['off'])
-    for instance_id in stopped_instances:
+                                          status_filters=['off'],
+                                          instances=all_instances)
+
+    def _start_instance_thread(instance_id: str) -> None:
         try:
             client.start(instance_id=instance_id)
         except utils.PaperspaceCloudError as e:
             if 'This machine is currently starting.' in str(e):
-                continue
+                return
             raise e
+
+    subprocess_utils.run_in_parallel(_start_instance_thread,
+                                     list(stopped_instances))
+    backoff = common_utils.Backoff(initial_backoff=INITIAL_BACKOFF_SECONDS,
+                                   max_backoff_factor=MAX_BACKOFF_FACTOR)
     while True:
         instances = _filter_instances(cluster_name_on_cloud,
-                                      pending_status + ['off'])
+                                      _PENDING_OR_OFF_STATES)
         if not instances:
             break
         num_stopped_instances = len(stopped_instances)
@@ -97,7 +139,7 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         logger.info(
             f'Waiting for {num_restarted_instances}/{num_stopped_instances} '
             'stopped instances to be restarted.')
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
 
     exist_instances = _filter_instances(cluster_name_on_cloud,
                                         status_filters=['ready'])
@@ -128,9 +170,11 @@ def run_instances(region: str, cluster_name_on_cloud: str,
             created_instance_ids=[],
         )
 
-    created_instance_ids = []
-    for _ in range(to_start_count):
-        node_type = 'head' if head_instance_id is None else 'worker'
+    node_types = ['worker'] * to_start_count
+    if head_instance_id is None:
+        node_types[0] = 'head'
+
+    def _launch_instance_thread(node_type: str) -> str:
         try:
             instance_id = client.launch(
                 name=f'{cluster_name_on_cloud}-{node_type}',
@@ -143,9 +187,14 @@ def run_instances(region: str, cluster_name_on_cloud: str,
             logger.warning(f'run_instances error: {e}')
             raise e
         logger.info(f'Launched instance {instance_id}.')
-        created_instance_ids.append(instance_id)
-        if head_instance_id is None:
-            head_instance_id = instance_id
+        return instance_id
+
+    # Launch requests are independent, so issue them in parallel. Results
+    # keep the order of node_types, so a new head is always the first id.
+    created_instance_ids = subprocess_utils.run_in_parallel(
+        _launch_instance_thread, node_types)
+    if head_instance_id is None:
+        head_instance_id = created_instance_ids[0]
 
     # Wait for instances to be ready.
     for _ in range(MAX_POLLS_FOR_UP_OR_STOP):
@@ -187,19 +236,20 @@ def stop_instances(
 ) -> None:
     del provider_config  # unused
     client = utils.PaperspaceCloudClient()
-    all_instances = _filter_instances(cluster_name_on_cloud, [
-        'ready', 'serviceready', 'upgrading', 'provisioning', 'starting',
-        'restarting'
-    ])
-    num_instances = len(all_instances)
+    all_instances = _filter_instances(cluster_name_on_cloud, _STOPPABLE_STATES)
+    instance_ids = [
+        instance_id for instance_id, instance in all_instances.items()
+        if not (worker_only and instance['name'].endswith('-head'))
+    ]
+    num_instances = len(instance_ids)
 
-    # Request a stop on all instances
-    for instance_id, instance in all_instances.items():
-        if worker_only and instance['name'].endswith('-head'):
-            num_instances -= 1
-            continue
+    def _stop_instance_thread(instance_id: str) -> None:
+        logger.debug(f'Stopping instance {instance_id}')
         client.stop(instance_id=instance_id)
 
+    # Request a stop on all instances in parallel.
+    subprocess_utils.run_in_parallel(_stop_instance_thread, instance_ids)
+
     # Wait for instances to stop
     for _ in range(MAX_POLLS_FOR_UP_OR_STOP):
         all_instances = _filter_instances(cluster_name_on_cloud, ['off'])
@@ -222,10 +272,9 @@ def terminate_instances(
     del provider_config  # unused
     client = utils.PaperspaceCloudClient()
     instances = _filter_instances(cluster_name_on_cloud, None)
-    for inst_id, inst in instances.items():
+
+    def _terminate_instance_thread(inst_id: str) -> None:
         logger.debug(f'Terminating instance {inst_id}')
-        if worker_only and inst['name'].endswith('-head'):
-            continue
         try:
             client.remove(inst_id)
         except Exception as e:  # pylint: disable=broad-except
@@ -235,6 +284,12 @@ def terminate_instances(
                     f'{common_utils.format_exception(e, use_bracket=False)}'
                 ) from e
 
+    # The removals are independent, so issue them in parallel.
+    subprocess_utils.run_in_parallel(_terminate_instance_thread, [
+        inst_id for inst_id, inst in instances.items()
+        if not (worker_only and inst['name'].endswith('-head'))
+    ])
+
     # TODO(asaiacai): Possible private network resource leakage for autodown
     if not worker_only:
         try:
@@ -285,23 +340,10 @@ def query_instances(
     del non_terminated_only
     assert provider_config is not None, (cluster_name_on_cloud, provider_config)
     instances = _filter_instances(cluster_name_on_cloud, None)
-
-    # https://docs.digitalocean.com/reference/paperspace/core/commands/machines/#show
-    status_map = {
-        'starting': status_lib.ClusterStatus.INIT,
-        'restarting': status_lib.ClusterStatus.INIT,
-        'upgrading': status_lib.ClusterStatus.INIT,
-        'provisioning': status_lib.ClusterStatus.INIT,
-        'stopping': status_lib.ClusterStatus.STOPPED,
-        'serviceready': status_lib.ClusterStatus.INIT,
-        'ready': status_lib.ClusterStatus.UP,
-        'off': status_lib.ClusterStatus.STOPPED,
+    return {
+        inst_id: _STATUS_MAP[inst['state']]
+        for inst_id, inst in instances.items()
     }
-    statuses: Dict[str, Optional[status_lib.ClusterStatus]] = {}
-    for inst_id, inst in instances.items():
-        status = status_map[inst['state']]
-        statuses[inst_id] = status
-    return statuses
 
 
 def open_ports(
@@ -196,6 +196,13 @@ class PaperspaceCloudClient:
     def list_instances(self) -> List[Dict[str, Any]]:
         return self.list_endpoint(endpoint='machines')
 
+    def check_credentials(self) -> None:
+        """Verifies the API key with a single, one-item page request."""
+        _try_request_with_backoff('get',
+                                  f'{API_ENDPOINT}/machines',
+                                  headers=self.headers,
+                                  data={'limit': 1})
+
     def launch(self, name: str, instance_type: str, network_id: str,
                region: str, disk_size: int) -> Dict[str, Any]:
         response = _try_request_with_backoff(
@@ -1,6 +1,12 @@
+from unittest import mock
+
 import pytest
 
+from sky import clouds
+from sky import exceptions
+from sky import skypilot_config
 from sky.clouds.cloud import Cloud
+from sky.clouds.paperspace import Paperspace
 
 
 @pytest.mark.parametrize(("specific_reservations", "expected"), [({"a"}, {
@@ -12,3 +18,21 @@ def test_cloud_get_reservations_available_resources(specific_reservations,
     available_resources = Cloud().get_reservations_available_resources(
         "instance_type", "region", "zone", specific_reservations)
     assert available_resources == expected
+
+
+def test_check_features_does_not_mutate_class_unsupported_features():
+    """A proxy command must not leak DOCKER_IMAGE into the class-level dict."""
+    docker_image = clouds.CloudImplementationFeatures.DOCKER_IMAGE
+    resources = mock.MagicMock()
+    with mock.patch.object(skypilot_config,
+                           'get_effective_region_config',
+                           return_value='ssh -W %h:%p jump-host'):
+        with pytest.raises(exceptions.NotSupportedError):
+            Paperspace.check_features_are_supported(resources, {docker_image})
+    assert docker_image not in Paperspace._CLOUD_UNSUPPORTED_FEATURES
+
+    # Without the proxy command, DOCKER_IMAGE must be accepted again.
+    with mock.patch.object(skypilot_config,
+                           'get_effective_region_config',
+                           return_value=None):
+        Paperspace.check_features_are_supported(resources, {docker_image})
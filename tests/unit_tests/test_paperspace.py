@@ -0,0 +1,196 @@
+"""Tests for Paperspace cloud provider."""
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from sky.provision.paperspace import instance
+from sky.provision.paperspace import utils
+
+
+def _machine(instance_id, name, state):
+    return {'id': instance_id, 'name': name, 'state': state}
+
+
+def _mock_client(machines):
+    """Patches the Paperspace client to serve and update `machines`."""
+    patcher = mock.patch.object(utils, 'PaperspaceCloudClient')
+    mock_client = patcher.start().return_value
+    mock_client.list_instances.side_effect = lambda: list(machines)
+    return patcher, mock_client
+
+
+def test_provision_routes_to_paperspace_without_credential_check():
+    """The provisioner must resolve Paperspace without a prior sky check.
+
+    sky.provision only finds the Paperspace provider module if importing the
+    cloud registers it, so this runs in a fresh interpreter where imports made
+    by other tests cannot register it as a side effect.
+    """
+    script = textwrap.dedent("""
+        from unittest import mock
+
+        from sky import provision
+        from sky.clouds import paperspace
+        from sky.utils import status_lib
+
+        with mock.patch.object(paperspace.Paperspace,
+                               '_check_compute_credentials') as mock_check, \\
+                mock.patch.object(paperspace.utils,
+                                  'PaperspaceCloudClient') as mock_client_cls:
+            mock_client_cls.return_value.list_instances.return_value = [{
+                'id': 'ps-head',
+                'name': 'test-cluster-head',
+                'state': 'ready',
+            }, {
+                'id': 'ps-other',
+                'name': 'other-cluster-head',
+                'state': 'ready',
+            }]
+            statuses = provision.query_instances('paperspace',
+                                                 'test-cluster',
+                                                 provider_config={})
+            mock_check.assert_not_called()
+        assert statuses == {'ps-head': status_lib.ClusterStatus.UP}, statuses
+        """)
+    proc = subprocess.run([sys.executable, '-c', script],
+                          capture_output=True,
+                          text=True,
+                          check=False)
+    assert proc.returncode == 0, proc.stderr
+
+
+@mock.patch.object(instance.time, 'sleep')
+def test_terminate_worker_only_keeps_head(mock_sleep):
+    del mock_sleep  # unused
+    machines = [
+        _machine('ps-head', 'test-cluster-head', 'ready'),
+        _machine('ps-w1', 'test-cluster-worker', 'ready'),
+        _machine('ps-w2', 'test-cluster-worker', 'off'),
+        _machine('ps-other', 'other-cluster-worker', 'ready'),
+    ]
+    patcher, mock_client = _mock_client(machines)
+    try:
+        instance.terminate_instances('test-cluster', worker_only=True)
+    finally:
+        patcher.stop()
+    removed = sorted(call.args[0] for call in mock_client.remove.call_args_list)
+    assert removed == ['ps-w1', 'ps-w2']
+    mock_client.delete_network.assert_not_called()
+
+
+@mock.patch.object(instance.time, 'sleep')
+def test_run_instances_launches_one_head_first(mock_sleep):
+    del mock_sleep  # unused
+    real_sleep = time.sleep
+    machines = []
+    lock = threading.Lock()
+
+    def _launch(name, **kwargs):
+        del kwargs  # unused
+        if name.endswith('-head'):
+            # Finish the head launch last to check that the created ids
+            # follow the launch order rather than the completion order.
+            real_sleep(0.2)
+        with lock:
+            instance_id = f'ps-{len(machines)}'
+            machines.append(_machine(instance_id, name, 'ready'))
+        return {'data': {'id': instance_id}}
+
+    patcher, mock_client = _mock_client(machines)
+    mock_client.launch.side_effect = _launch
+    config = mock.MagicMock(count=3,
+                            node_config={
+                                'InstanceType': 'C4',
+                                'NetworkId': 'net-1',
+                                'DiskSize': 50,
+                            })
+    try:
+        record = instance.run_instances('East Coast (NY2)', 'test-cluster',
+                                        config)
+    finally:
+        patcher.stop()
+
+    launched = [
+        call.kwargs['name'] for call in mock_client.launch.call_args_list
+    ]
+    assert launched.count('test-cluster-head') == 1
+    assert len(launched) == 3
+    names = {m['id']: m['name'] for m in machines}
+    assert names[record.head_instance_id] == 'test-cluster-head'
+    assert record.created_instance_ids[0] == record.head_instance_id
+    assert [names[i] for i in record.created_instance_ids] == [
+        'test-cluster-head', 'test-cluster-worker', 'test-cluster-worker'
+    ]
+
+
+@mock.patch.object(instance.time, 'sleep')
+def test_run_instances_skips_machine_already_starting(mock_sleep):
+    del mock_sleep  # unused
+    machines = [
+        _machine('ps-head', 'test-cluster-head', 'off'),
+        _machine('ps-w1', 'test-cluster-worker', 'off'),
+    ]
+
+    def _start(instance_id):
+        machine = next(m for m in machines if m['id'] == instance_id)
+        machine['state'] = 'ready'
+        if instance_id == 'ps-w1':
+            raise utils.PaperspaceCloudError(
+                'This machine is currently starting.')
+
+    patcher, mock_client = _mock_client(machines)
+    mock_client.start.side_effect = _start
+    config = mock.MagicMock(count=2)
+    try:
+        record = instance.run_instances('East Coast (NY2)', 'test-cluster',
+                                        config)
+    finally:
+        patcher.stop()
+
+    assert mock_client.start.call_count == 2
+    mock_client.launch.assert_not_called()
+    assert record.head_instance_id == 'ps-head'
+    assert sorted(record.resumed_instance_ids) == ['ps-head', 'ps-w1']
+
+
+def test_run_instances_raises_other_start_errors():
+    machines = [_machine('ps-head', 'test-cluster-head', 'off')]
+    patcher, mock_client = _mock_client(machines)
+    mock_client.start.side_effect = utils.PaperspaceCloudError('Out of quota.')
+    try:
+        with pytest.raises(utils.PaperspaceCloudError, match='Out of quota.'):
+            instance.run_instances('East Coast (NY2)', 'test-cluster',
+                                   mock.MagicMock(count=1))
+    finally:
+        patcher.stop()
+
+
+@mock.patch.object(instance.time, 'sleep')
+def test_stop_worker_only_keeps_head(mock_sleep):
+    del mock_sleep  # unused
+    machines = [
+        _machine('ps-head', 'test-cluster-head', 'ready'),
+        _machine('ps-w1', 'test-cluster-worker', 'ready'),
+        _machine('ps-w2', 'test-cluster-worker', 'ready'),
+    ]
+
+    def _stop(instance_id):
+        machine = next(m for m in machines if m['id'] == instance_id)
+        machine['state'] = 'off'
+
+    patcher, mock_client = _mock_client(machines)
+    mock_client.stop.side_effect = _stop
+    try:
+        instance.stop_instances('test-cluster', worker_only=True)
+    finally:
+        patcher.stop()
+
+    stopped = sorted(
+        call.kwargs['instance_id'] for call in mock_client.stop.call_args_list)
+    assert stopped == ['ps-w1', 'ps-w2']
+    assert machines[0]['state'] == 'ready'